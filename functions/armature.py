@@ -1147,157 +1147,164 @@ class ArmatureUtils:
         matched_bones = get_matching_bones(armature_obj, bone_keywords)
         print(f"✅ Using all matched bones for bangs: {matched_bones}")
 
-        # Store original selection and active object
-        original_selection = [obj for obj in context.selected_objects]
-        original_active = context.active_object
-
-        # Clear selection and set only hair object as active and selected
-        bpy.ops.object.select_all(action='DESELECT')
-        hair_obj.select_set(True)
-        context.view_layer.objects.active = hair_obj
-        bpy.ops.object.mode_set(mode='OBJECT')
+        # Store original selection and active object by name, so restoring never
+        # touches stale object references
+        original_selection = {obj.name for obj in context.selected_objects}
+        original_active_name = context.active_object.name if context.active_object else None
 
-        weights = get_vert_weights(hair_obj)
-
-        selected_verts = set()
-        for v in hair_obj.data.vertices:
-            vw = weights.get(v.index, {})
-            if any(bone in vw for bone in matched_bones):
-                # Check vertex position in world space (Y-axis is forward/backward)
-                world_pos = hair_obj.matrix_world @ v.co
-                if world_pos.y <= y_boundary:  # Only vertices not extending beyond boundary
-                    selected_verts.add(v.index)
-                # else:
-                #     print(f"Filtered out vertex {v.index} at Y position {world_pos.y:.3f}m (beyond boundary)")
-
-        if not selected_verts:
-            print("⚠️ No vertices matched the specified bone weights.")
-            return False
+        try:
+            # Clear selection and set only hair object as active and selected
+            bpy.ops.object.select_all(action='DESELECT')
+            hair_obj.select_set(True)
+            context.view_layer.objects.active = hair_obj
+            bpy.ops.object.mode_set(mode='OBJECT')
 
-        # Use selected vertices directly without expansion
-        final_verts = selected_verts
+            weights = get_vert_weights(hair_obj)
 
-        # Store original hair material for duplication
-        original_hair_material = None
-        if hair_obj.data.materials:
-            original_hair_material = hair_obj.data.materials[0]
-        else:
-            print("❌ Hair object has no materials to duplicate.")
-            return False
+            selected_verts = set()
+            for v in hair_obj.data.vertices:
+                vw = weights.get(v.index, {})
+                if any(bone in vw for bone in matched_bones):
+                    # Check vertex position in world space (Y-axis is forward/backward)
+                    world_pos = hair_obj.matrix_world @ v.co
+                    if world_pos.y <= y_boundary:  # Only vertices not extending beyond boundary
+                        selected_verts.add(v.index)
+                    # else:
+                    #     print(f"Filtered out vertex {v.index} at Y position {world_pos.y:.3f}m (beyond boundary)")
 
-        # Check if bangs material already exists
-        expected_bangs_name = original_hair_material.name.replace("Hair", "Bangs")
-        bangs_material = None
-        bangs_material_index = -1
-        
-        # Look for existing bangs material in the hair object
-        for i, material in enumerate(hair_obj.data.materials):
-            if material and material.name == expected_bangs_name:
-                bangs_material = material
-                bangs_material_index = i
-                print(f"✅ Found existing bangs material '{bangs_material.name}' at index {i}.")
-                break
-        
-        # Create bangs material if it doesn't exist
-        if bangs_material is None:
-            bangs_material = original_hair_material.copy()
-            bangs_material.name = expected_bangs_name
-            
-            # Add bangs material to the hair object
-            hair_obj.data.materials.append(bangs_material)
-            bangs_material_index = len(hair_obj.data.materials) - 1
-            print(f"✅ Created new bangs material '{bangs_material.name}' at index {bangs_material_index}.")
-
-        # Make sure we're working with the hair object only
-        bpy.ops.object.select_all(action='DESELECT')
-        hair_obj.select_set(True)
-        context.view_layer.objects.active = hair_obj
-
-        # Switch to edit mode to assign materials to bang faces
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='DESELECT')
-        bpy.ops.object.mode_set(mode='OBJECT')
+            if not selected_verts:
+                print("⚠️ No vertices matched the specified bone weights.")
+                return False
 
-        # Switch to edit mode and work with faces from the start
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='DESELECT')
-        bpy.ops.mesh.select_mode(type='FACE')
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # Select faces that have bang vertices weighted to our bones
-        for face in hair_obj.data.polygons:
-            # Check if any vertices of this face are bang vertices
-            any_vert_is_bang = any(v_idx in final_verts for v_idx in face.vertices)
-            
-            if any_vert_is_bang:
-                face.select = True
-        
-        # Now go to edit mode and select all linked faces plus nearby disconnected geometry
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_linked()
-        
-        # Also select nearby faces that might be part of the same hair strand but disconnected
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # Get all currently selected faces as reference points
-        selected_face_centers = []
-        for face in hair_obj.data.polygons:
-            if face.select:
-                # Calculate face center in world space
-                face_center = sum((hair_obj.matrix_world @ hair_obj.data.vertices[v_idx].co for v_idx in face.vertices), mathutils.Vector()) / len(face.vertices)
-                selected_face_centers.append(face_center)
-        
-        # Select additional faces that are close to selected faces (likely same hair strand)
-        proximity_threshold = 0.02  # 5cm threshold for considering faces as part of same strand
-        for face in hair_obj.data.polygons:
-            if not face.select:  # Only check unselected faces
-                face_center = sum((hair_obj.matrix_world @ hair_obj.data.vertices[v_idx].co for v_idx in face.vertices), mathutils.Vector()) / len(face.vertices)
-                
-                # Check if this face is close to any selected face
-                for selected_center in selected_face_centers:
-                    distance = (face_center - selected_center).length
-                    if distance <= proximity_threshold:
-                        face.select = True
-                        break  # Don't need to check other selected faces
-        
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Apply Y boundary filter after linked selection to prevent over-extension
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # Deselect faces that extend too far beyond the Y boundary
-        for face in hair_obj.data.polygons:
-            if face.select:
-                # Check if any vertex of this face extends too far beyond the boundary
-                any_vert_too_far = any(
-                    (hair_obj.matrix_world @ hair_obj.data.vertices[v_idx].co).y > (y_boundary + 0.05)  # Allow 30cm buffer
-                    for v_idx in face.vertices
-                )
-                
-                if any_vert_too_far:
-                    face.select = False
-        
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Assign bangs material to selected faces
-        hair_obj.active_material_index = bangs_material_index
-        bpy.ops.object.material_slot_assign()
-        
-        # Deselect all and return to object mode
-        bpy.ops.mesh.select_all(action='DESELECT')
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        print(f"✅ Created bangs material '{bangs_material.name}' and assigned to bang faces.")
-        
-        # Restore original selection and active object
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in original_selection:
-            if obj and obj.name in bpy.data.objects:
-                obj.select_set(True)
-        if original_active and original_active.name in bpy.data.objects:
-            context.view_layer.objects.active = original_active
-        
-        return True
+            # Use selected vertices directly without expansion
+            final_verts = selected_verts
+
+            # Store original hair material for duplication
+            original_hair_material = None
+            if hair_obj.data.materials:
+                original_hair_material = hair_obj.data.materials[0]
+            else:
+                print("❌ Hair object has no materials to duplicate.")
+                return False
+
+            # Check if bangs material already exists
+            expected_bangs_name = original_hair_material.name.replace("Hair", "Bangs")
+            bangs_material = None
+            bangs_material_index = -1
+
+            # Look for existing bangs material in the hair object
+            for i, material in enumerate(hair_obj.data.materials):
+                if material and material.name == expected_bangs_name:
+                    bangs_material = material
+                    bangs_material_index = i
+                    print(f"✅ Found existing bangs material '{bangs_material.name}' at index {i}.")
+                    break
+
+            # Create bangs material if it doesn't exist
+            if bangs_material is None:
+                bangs_material = original_hair_material.copy()
+                bangs_material.name = expected_bangs_name
+
+                # Add bangs material to the hair object
+                hair_obj.data.materials.append(bangs_material)
+                bangs_material_index = len(hair_obj.data.materials) - 1
+                print(f"✅ Created new bangs material '{bangs_material.name}' at index {bangs_material_index}.")
+
+            # Make sure we're working with the hair object only
+            bpy.ops.object.select_all(action='DESELECT')
+            hair_obj.select_set(True)
+            context.view_layer.objects.active = hair_obj
+
+            # Switch to edit mode and work with faces from the start
+            bpy.ops.object.mode_set(mode='EDIT')
+            bpy.ops.mesh.select_all(action='DESELECT')
+            bpy.ops.mesh.select_mode(type='FACE')
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+            # Select faces that have bang vertices weighted to our bones
+            for face in hair_obj.data.polygons:
+                # Check if any vertices of this face are bang vertices
+                any_vert_is_bang = any(v_idx in final_verts for v_idx in face.vertices)
+
+                if any_vert_is_bang:
+                    face.select = True
+
+            # Now go to edit mode and select all linked faces plus nearby disconnected geometry
+            bpy.ops.object.mode_set(mode='EDIT')
+            bpy.ops.mesh.select_linked()
+
+            # Also select nearby faces that might be part of the same hair strand but disconnected
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+            # Get all currently selected faces as reference points
+            selected_face_centers = []
+            for face in hair_obj.data.polygons:
+                if face.select:
+                    # Calculate face center in world space
+                    face_center = sum((hair_obj.matrix_world @ hair_obj.data.vertices[v_idx].co for v_idx in face.vertices), mathutils.Vector()) / len(face.vertices)
+                    selected_face_centers.append(face_center)
+
+            # Select additional faces that are close to selected faces (likely same hair strand)
+            proximity_threshold = 0.02  # 5cm threshold for considering faces as part of same strand
+            for face in hair_obj.data.polygons:
+                if not face.select:  # Only check unselected faces
+                    face_center = sum((hair_obj.matrix_world @ hair_obj.data.vertices[v_idx].co for v_idx in face.vertices), mathutils.Vector()) / len(face.vertices)
+
+                    # Check if this face is close to any selected face
+                    for selected_center in selected_face_centers:
+                        distance = (face_center - selected_center).length
+                        if distance <= proximity_threshold:
+                            face.select = True
+                            break  # Don't need to check other selected faces
+
+            bpy.ops.object.mode_set(mode='EDIT')
+
+            # Apply Y boundary filter after linked selection to prevent over-extension
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+            # Deselect faces that extend too far beyond the Y boundary
+            for face in hair_obj.data.polygons:
+                if face.select:
+                    # Check if any vertex of this face extends too far beyond the boundary
+                    any_vert_too_far = any(
+                        (hair_obj.matrix_world @ hair_obj.data.vertices[v_idx].co).y > (y_boundary + 0.05)  # Allow 30cm buffer
+                        for v_idx in face.vertices
+                    )
+
+                    if any_vert_too_far:
+                        face.select = False
+
+            bpy.ops.object.mode_set(mode='EDIT')
+
+            # Assign bangs material to selected faces
+            hair_obj.active_material_index = bangs_material_index
+            bpy.ops.object.material_slot_assign()
+
+            # Deselect all and return to object mode
+            bpy.ops.mesh.select_all(action='DESELECT')
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+            print(f"✅ Created bangs material '{bangs_material.name}' and assigned to bang faces.")
+
+            return True
+
+        finally:
+            # Always leave edit mode, even after an error part way through
+            if context.mode != 'OBJECT':
+                bpy.ops.object.mode_set(mode='OBJECT')
+
+            # Restore original selection and active object, only flipping objects
+            # whose selection state actually differs
+            for obj in context.selected_objects:
+                if obj.name not in original_selection:
+                    obj.select_set(False)
+            for name in original_selection:
+                obj = bpy.data.objects.get(name)
+                if obj and not obj.select_get():
+                    obj.select_set(True)
+            original_active = bpy.data.objects.get(original_active_name) if original_active_name else None
+            if original_active:
+                context.view_layer.objects.active = original_active
     
     @staticmethod
     def adjust_bone_tails_to_connect(context: Optional[bpy.types.Context] = None,
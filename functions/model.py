@@ -1,9 +1,139 @@
 import bpy
+import bisect
+import logging
 import re
+from collections import Counter
 from typing import Optional
 from .scene import SceneUtils
 import bmesh
 import mathutils
+import numpy as np
+
+# Numba is optional - Blender doesn't bundle it, so fall back to plain NumPy without it
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# SciPy is optional as well - when present, its cKDTree answers all nearest-vertex queries in one call
+try:
+    from scipy.spatial import cKDTree
+    _HAS_SCIPY = True
+except ImportError:
+    _HAS_SCIPY = False
+
+log = logging.getLogger(__name__)
+
+# Meshes removed by clean_meshes: exact unwanted names, any "lod" (case-insensitive),
+# AO_Bip helpers and _Low/_EffectMesh variants
+_MESH_REMOVE_RE = re.compile(r"\A(?:EffectMesh|Weapon_[LR])\Z|(?i:lod)|AO_Bip|(?:_Low|_EffectMesh)\Z")
+
+# Face rig actions converted by face_rig_to_shapekey, skipping numbered duplicates like .001;
+# the shape key name is everything after the action name's second underscore
+_FACE_ACTION_RE = re.compile(r"(?=.*?(?:Emo|Ani|PhotoGraph)_(?!.*\.\d{2,}$))[^_]*_[^_]*_(?P<key>.*)")
+
+# Leading token of a mesh name up to and including its first '_' or '.' separator
+_NAME_HEAD_RE = re.compile(r"[^._]*[._]")
+
+# Upper bounds on a model's max dimension and the (scale factor, direction) used by scale_model
+# for each band - the 0.01 bound was restored since 0.02 was too high
+_SCALE_THRESHOLDS = (0.000002, 0.00002, 0.0002, 0.002, 0.01, 10, 100)
+_SCALE_ACTIONS = (
+    (1000000, "up"),
+    (100000, "up"),
+    (10000, "up"),
+    (1000, "up"),
+    (100, "up"),
+    (1.0, None),
+    (0.1, "down"),
+    (0.01, "down"),
+)
+
+# Reusable NumPy buffers, grown as needed so repeated mesh operations don't reallocate them
+_SCRATCH = {}
+
+def _scratch_buffer(name: str, size: int, dtype=np.float32) -> np.ndarray:
+    """Get a flat reusable buffer of at least the given size (contents are undefined)"""
+    buf = _SCRATCH.get(name)
+    if buf is None or buf.size < size or buf.dtype != dtype:
+        buf = np.empty(size, dtype=dtype)
+        _SCRATCH[name] = buf
+    return buf[:size]
+
+if _HAS_NUMBA:
+    @njit(parallel=True)
+    def _blend_shape_offsets(basis, sources, values, out):
+        """Write basis + sum(values[k] * (sources[k] - basis)) into out, in parallel over coordinates"""
+        for i in prange(basis.shape[0]):
+            base = basis[i]
+            co = base
+            for k in range(values.shape[0]):
+                co += values[k] * (sources[k, i] - base)
+            out[i] = co
+else:
+    def _blend_shape_offsets(basis, sources, values, out):
+        """Write basis + sum(values[k] * (sources[k] - basis)) into out"""
+        out[:] = basis
+        for k in range(values.shape[0]):
+            out += values[k] * (sources[k] - basis)
+
+if _HAS_NUMBA:
+    @njit(parallel=True)
+    def _faces_touching(vert_mask, loop_verts, loop_starts, loop_totals, out):
+        """Set out[f] when any loop of face f uses a vertex flagged in vert_mask, in parallel over faces"""
+        for f in prange(loop_starts.shape[0]):
+            start = loop_starts[f]
+            hit = False
+            for loop in range(start, start + loop_totals[f]):
+                if vert_mask[loop_verts[loop]]:
+                    hit = True
+                    break
+            out[f] = hit
+else:
+    def _faces_touching(vert_mask, loop_verts, loop_starts, loop_totals, out):
+        """Set out[f] when any loop of face f uses a vertex flagged in vert_mask"""
+        out[:] = np.logical_or.reduceat(vert_mask[loop_verts], loop_starts)
+
+def _scene_meshes(context: bpy.types.Context) -> list:
+    """All mesh objects in the context's scene, gathered in a single pass"""
+    return [obj for obj in context.scene.objects if obj.type == 'MESH']
+
+def _closest_vertices(source_co: np.ndarray, target_co: np.ndarray, max_dist: float) -> np.ndarray:
+    """Index of the closest source vertex for each target vertex, or -1 where none is within max_dist
+
+    Both coordinate arrays are (n, 3).
+    """
+    if _HAS_SCIPY:
+        dists, indices = cKDTree(source_co).query(target_co, distance_upper_bound=max_dist)
+        return np.where(dists < max_dist, indices, -1)
+
+    # Build a KD-tree of the source vertices once instead of scanning them per target vertex
+    kd = mathutils.kdtree.KDTree(len(source_co))
+    for j, co in enumerate(source_co.tolist()):
+        kd.insert(co, j)
+    kd.balance()
+
+    matches = np.full(len(target_co), -1, dtype=np.int64)
+    for i, co in enumerate(target_co.tolist()):
+        _, closest_vert, min_dist = kd.find(co)
+        if closest_vert is not None and min_dist < max_dist:
+            matches[i] = closest_vert
+    return matches
+
+def _restore_shape_key_values(obj, original_values: dict) -> None:
+    """Write saved shape key values back, in one foreach_set when the key layout is unchanged"""
+    if not obj.data.shape_keys:
+        return
+    key_blocks = obj.data.shape_keys.key_blocks
+    if key_blocks.keys() == list(original_values):
+        values = np.fromiter(original_values.values(), dtype=np.float32, count=len(original_values))
+        key_blocks.foreach_set("value", values)
+        return
+    for sk in key_blocks:
+        value = original_values.get(sk.name)
+        if value is not None:
+            sk.value = value
 
 class ModelUtils:
     """Utility class for model operations"""
@@ -14,30 +144,30 @@ class ModelUtils:
         if not context:
             context = bpy.context
             
-        unwanted_meshes = ["EffectMesh", "Weapon_L", "Weapon_R"]
+        keep_star_eye = context.scene.keep_star_eye_mesh
         
-        for obj in bpy.data.objects:
+        # Collect meshes to remove and deselect the rest in a single pass
+        scene_objects = context.scene.objects
+        to_remove = []
+        for obj in scene_objects:
             if obj.type != "MESH":
                 continue
                 
             # Check various conditions for removal
+            name = obj.name
             should_remove = (
-                obj.name in unwanted_meshes
-                or "lod" in obj.name.lower()
-                or "AO_Bip" in obj.name 
-                or obj.name.endswith("_Low")
-                or obj.name.endswith("_EffectMesh")
-                or (obj.name == "EyeStar" and not context.scene.keep_star_eye_mesh)
+                _MESH_REMOVE_RE.search(name) is not None
+                or (name == "EyeStar" and not keep_star_eye)
             )
             
             if should_remove:
-                bpy.data.objects.remove(obj, do_unlink=True)
-        
-        # Deselect all meshes
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH':
+                to_remove.append(obj)
+            else:
                 obj.select_set(False)
-                
+        
+        # Remove all unwanted meshes at once
+        if to_remove:
+            bpy.data.batch_remove(ids=to_remove)
 
         return True
     
@@ -48,55 +178,29 @@ class ModelUtils:
             context = bpy.context
             
         # Find armature
-        armature = None
-        for obj in context.scene.objects:
-            if obj.type == 'ARMATURE':
-                armature = obj
-                break
+        scene_objects = context.scene.objects
+        armature = next((obj for obj in scene_objects if obj.type == 'ARMATURE'), None)
                 
         # If no armature, get all meshes
-        objects_to_scale = []
         if armature:
             objects_to_scale = [armature]
         else:
-            for obj in context.scene.objects:
-                if obj.type == 'MESH':
-                    objects_to_scale.append(obj)
+            objects_to_scale = [obj for obj in scene_objects if obj.type == 'MESH']
                     
         if not objects_to_scale:
             print("No armature or meshes found in scene")
             return False
             
         # Get dimensions and calculate max from first object
-        dimensions = objects_to_scale[0].dimensions
-        max_dim = max(dimensions)
-        print(f"Dimensions: X={dimensions.x:.8f}, Y={dimensions.y:.8f}, Z={dimensions.z:.8f}")
-        print(f"Max dimension: {max_dim:.8f}")
+        # (read once - every .dimensions access recomputes the bounding box)
+        dims = tuple(objects_to_scale[0].dimensions)
+        max_dim = max(dims)
+        log.debug("Dimensions: X=%.8f, Y=%.8f, Z=%.8f", *dims)
+        log.debug("Max dimension: %.8f", max_dim)
         
         # Scale model based on size - using much smaller thresholds
-        scale_factor = 1.0
-        if max_dim <= 0.000002:  # 1e-6
-            scale_factor = 1000000
-            action = "up"
-        elif max_dim <= 0.00002:  # 1e-5
-            scale_factor = 100000
-            action = "up"
-        elif max_dim <= 0.0002:  # 1e-4
-            scale_factor = 10000
-            action = "up"
-        elif max_dim <= 0.002:  # 1e-3
-            scale_factor = 1000
-            action = "up"
-        elif max_dim <= 0.01:  # Restored to 0.01 since 0.02 was too high
-            scale_factor = 100
-            action = "up"
-        elif max_dim > 100:
-            scale_factor = 0.01
-            action = "down"
-        elif max_dim > 10:
-            scale_factor = 0.1
-            action = "down"
-        elif 1 < max_dim < 3:
+        scale_factor, action = _SCALE_ACTIONS[bisect.bisect_left(_SCALE_THRESHOLDS, max_dim)]
+        if scale_factor == 1.0 and 1 < max_dim < 3:
             print(f"Model is already a reasonable size (max dim: {max_dim:.8f})")
             return True
             
@@ -104,37 +208,39 @@ class ModelUtils:
         if scale_factor != 1.0:
             print(f"Scaling model {action} by {scale_factor}x (from {max_dim:.8f})")
             
-            # Store current selection
-            selected_objects = context.selected_objects[:]
-            active_object = context.active_object
+            # Store current selection by name (object references can go stale after transform_apply)
+            selected_names = [obj.name for obj in context.selected_objects]
+            active_name = context.active_object.name if context.active_object else None
             
             # Deselect all objects
-            for obj in context.selected_objects:
-                obj.select_set(False)
+            bpy.ops.object.select_all(action='DESELECT')
                 
             # Scale each object
             for obj in objects_to_scale:
                 obj.select_set(True)
-                context.view_layer.objects.active = obj
-                
                 obj.scale *= scale_factor
-                print(f"Scaled object: {obj.name}")
-                
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-                
-                # Print new dimensions
-                new_dims = obj.dimensions
-                print(f"New dimensions: X={new_dims.x:.8f}, Y={new_dims.y:.8f}, Z={new_dims.z:.8f}")
-                print(f"New max dimension: {max(new_dims):.8f}")
+                log.debug("Scaled object: %s", obj.name)
                 
+            # Apply scale to all scaled objects at once
+            context.view_layer.objects.active = objects_to_scale[0]
+            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+            
+            # Log new dimensions (reading .dimensions recomputes the bounding box, so only when debugging)
+            debug = log.isEnabledFor(logging.DEBUG)
+            for obj in objects_to_scale:
+                if debug:
+                    new_dims = tuple(obj.dimensions)
+                    log.debug("New dimensions: X=%.8f, Y=%.8f, Z=%.8f", *new_dims)
+                    log.debug("New max dimension: %.8f", max(new_dims))
                 obj.select_set(False)
             
             # Restore previous selection
-            for obj in selected_objects:
-                obj.select_set(True)
-            if active_object:
-                context.view_layer.objects.active = active_object
+            for name in selected_names:
+                obj = bpy.data.objects.get(name)
+                if obj:
+                    obj.select_set(True)
+            if active_name and active_name in bpy.data.objects:
+                context.view_layer.objects.active = bpy.data.objects[active_name]
 
         return True
 
@@ -192,10 +298,30 @@ class ModelUtils:
             return True  # Not an error, just nothing to do
             
         try:
+            # Objects resolved once per call, shared by validation, generation and create_mixed_shape_key
+            objects = {}
+            def get_object(name):
+                if name not in objects:
+                    objects[name] = bpy.data.objects.get(name)
+                return objects[name]
+                
+            # Shape key names per object, read once so repeated probes are set lookups
+            key_names = {}
+            def has_key(obj, key):
+                if obj.name not in key_names:
+                    shape_keys = obj.data.shape_keys
+                    key_names[obj.name] = frozenset(shape_keys.key_blocks.keys()) if shape_keys else frozenset()
+                return key in key_names[obj.name]
+                
+            # Index fallbacks by the key they replace, keeping their configured order
+            fallbacks_by_missing = {}
+            for fb in shape_key_config.get("fallback_keys", []):
+                fallbacks_by_missing.setdefault(fb["missing_key"], []).append(fb)
+                
             # Validate required base shape keys and apply fallbacks
             if "target_objects" in shape_key_config:
                 for obj_name, required_keys in shape_key_config["target_objects"].items():
-                    obj = bpy.data.objects.get(obj_name)
+                    obj = get_object(obj_name)
                     if not obj:
                         print(f"Object {obj_name} not found, skipping its shape keys")
                         continue
@@ -203,12 +329,11 @@ class ModelUtils:
                     # Check required keys and apply fallbacks
                     if "fallback_keys" in shape_key_config:
                         for key in required_keys:
-                            if not ModelUtils._has_shape_key(obj, key):
+                            if not has_key(obj, key):
                                 # Try to find a fallback
                                 fallback = next(
-                                    (fb for fb in shape_key_config["fallback_keys"] 
-                                     if fb["missing_key"] == key 
-                                     and ModelUtils._has_shape_key(obj, fb["fallback_key"])),
+                                    (fb for fb in fallbacks_by_missing.get(key, ())
+                                     if has_key(obj, fb["fallback_key"])),
                                     None
                                 )
                                 if fallback:
@@ -223,13 +348,13 @@ class ModelUtils:
                     if not sources:
                         continue
                         
-                    target_obj = bpy.data.objects.get(sources[0]["object"])
+                    target_obj = get_object(sources[0]["object"])
                     if not target_obj:
                         print(f"Target object {sources[0]['object']} not found for key {new_key}")
                         continue
                     
                     # Create the new shape key
-                    if not ModelUtils.create_mixed_shape_key(target_obj, new_key, sources):
+                    if not ModelUtils.create_mixed_shape_key(target_obj, new_key, sources, objects):
                         print(f"Failed to create shape key {new_key}")
                         
             return True
@@ -238,24 +363,22 @@ class ModelUtils:
             print(f"Error generating shape keys: {str(e)}")
             return False
     
-    @staticmethod
-    def _has_shape_key(obj: bpy.types.Object, key_name: str) -> bool:
-        """Check if an object has a specific shape key"""
-        if not obj.data.shape_keys:
-            return False
-        return key_name in obj.data.shape_keys.key_blocks
-    
     @staticmethod
     def create_mixed_shape_key(obj: bpy.types.Object, 
                               key_name: str, 
-                              sources: list) -> bool:
+                              sources: list,
+                              objects: Optional[dict] = None) -> bool:
         """Create a new shape key by mixing existing ones
         
         Args:
             obj: Target object
             key_name: Name of new shape key
             sources: List of source keys and their values
+            objects: Optional cache of objects by name, shared across calls and filled as sources are resolved
         """
+        if objects is None:
+            objects = {}
+            
         try:
             # Create new shape key
             new_key = obj.shape_key_add(name=key_name)
@@ -263,56 +386,89 @@ class ModelUtils:
                 return False
 
             # Initialize vertex positions from basis
+            # (float32 buffers match Blender's internal layout, so foreach_get/set copy directly)
             basis = obj.data.shape_keys.key_blocks['Basis']
-            for i in range(len(new_key.data)):
-                new_key.data[i].co = basis.data[i].co.copy()
+            basis_co = _scratch_buffer("shape_key_basis", len(new_key.data) * 3)
+            basis.data.foreach_get('co', basis_co)
+            new_key.data.foreach_set('co', basis_co)
 
-            # Group sources by object for simultaneous application
+            # Resolve source objects and shape key blocks once,
+            # grouped by object for simultaneous application
             sources_by_obj = {}
             for source in sources:
-                source_obj = bpy.data.objects.get(source["object"])
-                if not source_obj or not ModelUtils._has_shape_key(source_obj, source["source_key"]):
+                # Zero-influence sources contribute nothing
+                if not source["value"]:
                     continue
+                    
+                source_name = source["object"]
+                if source_name not in objects:
+                    objects[source_name] = bpy.data.objects.get(source_name)
+                source_obj = objects[source_name]
+                if not source_obj or not source_obj.data.shape_keys:
+                    continue
+                    
+                source_key = source_obj.data.shape_keys.key_blocks.get(source["source_key"])
+                if source_key is None:
+                    continue
+                
+                sources_by_obj.setdefault(source_obj, []).append((source_key.data, source["value"]))
                 
-                if source_obj not in sources_by_obj:
-                    sources_by_obj[source_obj] = []
-                sources_by_obj[source_obj].append(source)
+            # Nothing to mix - the new key already holds the basis positions
+            if not sources_by_obj:
+                obj.data.update()
+                return True
 
             # Process each object's shape keys
             for source_obj, obj_sources in sources_by_obj.items():
                 if source_obj == obj:
                     # Same object - direct vertex index mapping
-                    for i in range(len(new_key.data)):
-                        final_co = basis.data[i].co.copy()
-                        # Apply all influences from this object
-                        for source in obj_sources:
-                            source_key = source_obj.data.shape_keys.key_blocks[source["source_key"]]
-                            value = source["value"]
-                            offset = source_key.data[i].co - basis.data[i].co
-                            final_co += offset * value
-                        new_key.data[i].co = final_co
+                    # Stack every source key of this object so they're blended in one pass
+                    source_cos = _scratch_buffer("shape_key_sources", len(obj_sources) * basis_co.size)
+                    source_cos = source_cos.reshape(len(obj_sources), basis_co.size)
+                    values = np.empty(len(obj_sources), dtype=np.float32)
+                    for k, (source_data, value) in enumerate(obj_sources):
+                        source_data.foreach_get('co', source_cos[k])
+                        values[k] = value
+                        
+                    # Apply all influences from this object
+                    final_co = _scratch_buffer("shape_key_final", basis_co.size)
+                    _blend_shape_offsets(basis_co, source_cos, values, final_co)
+                    new_key.data.foreach_set('co', final_co)
                 else:
                     # Different object - need position matching
-                    for i, target_vert in enumerate(obj.data.vertices):
-                        # Find closest vertex in source object
-                        closest_vert = None
-                        min_dist = float('inf')
-                        for j, source_vert in enumerate(source_obj.data.vertices):
-                            dist = (target_vert.co - source_vert.co).length
-                            if dist < min_dist:
-                                min_dist = dist
-                                closest_vert = j
-
-                        if closest_vert is not None and min_dist < 0.0001:  # Threshold for vertex matching
-                            final_co = basis.data[i].co.copy()
-                            # Apply all influences from this object
-                            for source in obj_sources:
-                                source_key = source_obj.data.shape_keys.key_blocks[source["source_key"]]
-                                value = source["value"]
-                                offset = source_key.data[closest_vert].co - source_obj.data.shape_keys.key_blocks['Basis'].data[closest_vert].co
-                                final_co += offset * value
-                            new_key.data[i].co = final_co
+                    # Bulk-load both vertex sets once instead of reading them per vertex
+                    source_count = len(source_obj.data.vertices)
+                    source_co = np.empty(source_count * 3, dtype=np.float32)
+                    source_obj.data.vertices.foreach_get('co', source_co)
+                    target_co = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+                    obj.data.vertices.foreach_get('co', target_co)
 
+                    # Closest source vertex for each target vertex, -1 where none is close enough
+                    matches = _closest_vertices(
+                        source_co.reshape(-1, 3), target_co.reshape(-1, 3),
+                        0.0001  # Threshold for vertex matching
+                    )
+                    matched = matches >= 0
+                    closest = matches[matched]
+
+                    # Start matched vertices from the basis; unmatched ones keep their current position
+                    final_co = _scratch_buffer("shape_key_final", basis_co.size)
+                    new_key.data.foreach_get('co', final_co)
+                    matched_co = basis_co.reshape(-1, 3)[matched]
+
+                    # Apply all influences from this object
+                    source_basis_co = np.empty(source_count * 3, dtype=np.float32)
+                    source_obj.data.shape_keys.key_blocks['Basis'].data.foreach_get('co', source_basis_co)
+                    source_basis_co = source_basis_co.reshape(-1, 3)[closest]
+                    source_key_co = np.empty(source_count * 3, dtype=np.float32)
+                    for source_data, value in obj_sources:
+                        source_data.foreach_get('co', source_key_co)
+                        matched_co += (source_key_co.reshape(-1, 3)[closest] - source_basis_co) * value
+
+                    final_co.reshape(-1, 3)[matched] = matched_co
+                    new_key.data.foreach_set('co', final_co)
+
+            obj.data.update()
             return True
 
         except Exception as e:
@@ -357,18 +513,17 @@ class ModelUtils:
             # Store shape key state if needed
             original_shape_key_index = None
             if active_shape_key and target.data.shape_keys:
-                try:
+                key_blocks = target.data.shape_keys.key_blocks
+                key_index = key_blocks.find(active_shape_key)
+                if key_index == -1:
+                    print(f"Shape key {active_shape_key} not found")
+                else:
                     original_shape_key_index = target.active_shape_key_index
-                    key_index = target.data.shape_keys.key_blocks.keys().index(active_shape_key)
                     target.active_shape_key_index = key_index
-                    target.data.shape_keys.key_blocks[active_shape_key].value = 1.0
-                except (ValueError, KeyError):
-                    print(f"Shape key {active_shape_key} not found")
+                    key_blocks[key_index].value = 1.0
             
             # Deselect all meshes
-            for obj in bpy.data.objects:
-                if obj.type == 'MESH':
-                    obj.select_set(False)
+            SceneUtils.deselect_meshes(context)
             
             # Select target and set as active
             target.select_set(True)
@@ -387,20 +542,31 @@ class ModelUtils:
             if objects_to_merge:
                 bpy.ops.object.join()
             
-            # Switch to edit mode and merge vertices
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.remove_doubles(threshold=threshold)
-            bpy.ops.mesh.select_all(action='DESELECT')
+            # Merge vertices by distance directly on the mesh data, without an edit mode round trip
+            mesh = target.data
+            bm = bmesh.new()
+            bm.from_mesh(mesh)
+            shape_layers = bm.verts.layers.shape
+            shape_layer = shape_layers.get(active_shape_key) if active_shape_key else None
+            basis_layer = shape_layers.get(mesh.shape_keys.reference_key.name) if shape_layer else None
+            if shape_layer and basis_layer:
+                # Match vertices at the applied shape key's positions, like edit mode does
+                for v in bm.verts:
+                    v.co = v[shape_layer]
+            bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=threshold)
+            if shape_layer and basis_layer:
+                for v in bm.verts:
+                    v.co = v[basis_layer]
+            bm.to_mesh(mesh)
+            bm.free()
+            mesh.update()
             
             # Reset shape key if it was applied
-            if active_shape_key and target.data.shape_keys:
+            if original_shape_key_index is not None:
                 target.data.shape_keys.key_blocks[active_shape_key].value = 0
-                if original_shape_key_index is not None:
-                    target.active_shape_key_index = original_shape_key_index
+                target.active_shape_key_index = original_shape_key_index
             
-            # Restore original mode and cleanup
-            bpy.ops.object.mode_set(mode='OBJECT')
+            # Cleanup
             SceneUtils.cleanup_selection(context)
             
             return True
@@ -471,38 +637,56 @@ class ModelUtils:
             
         try:
             # Get all mesh objects
-            mesh_objects = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+            mesh_objects = _scene_meshes(context)
             
             for obj in mesh_objects:
                 mesh = obj.data
                 if len(mesh.uv_layers) <= 1:
                     continue
                     
-                # Get current UV layers and their names
-                uv_layers = [(i, layer.name) for i, layer in enumerate(mesh.uv_layers)]
+                # The first UV map stays in place; the rest follow in alphabetical order
+                names = [layer.name for layer in mesh.uv_layers]
+                target_names = names[:1] + sorted(names[1:])
                 
-                # Sort UV layers by name
-                sorted_layers = sorted(uv_layers, key=lambda x: x[1])
-                
-                # Check if reordering is needed
-                if [i for i, _ in uv_layers] != [i for i, _ in sorted_layers]:
-                    # Create a copy of UV data in the new order
-                    uv_data = {}
-                    for old_idx, name in sorted_layers:
-                        uv_data[name] = {
-                            'data': [uvloop.uv[:] for uvloop in mesh.uv_layers[old_idx].data]
-                        }
+                # Check if reordering is needed before touching any UV data
+                if names == target_names:
+                    continue
                     
-                    # Remove all UV layers except the first one
-                    while len(mesh.uv_layers) > 1:
-                        mesh.uv_layers.remove(mesh.uv_layers[-1])
+                # Copy the UV data of every layer that moves, plus the active/render maps;
+                # pin and selection flags are stored under the layer's name too, so they
+                # are copied along with the coordinates
+                loop_count = len(mesh.loops)
+                uv_data = {}
+                for layer, target_name in zip(mesh.uv_layers, target_names):
+                    if layer.name != target_name:
+                        uvs = np.empty(loop_count * 2, dtype=np.float32)
+                        layer.data.foreach_get('uv', uvs)
+                        flags = {}
+                        for prop in ('pin_uv', 'select', 'select_edge'):
+                            flags[prop] = np.empty(loop_count, dtype=bool)
+                            layer.data.foreach_get(prop, flags[prop])
+                        uv_data[layer.name] = (uvs, flags)
+                active_name = mesh.uv_layers.active.name if mesh.uv_layers.active else None
+                render_name = next((layer.name for layer in mesh.uv_layers if layer.active_render), None)
+                
+                # Rename and refill the existing layers in place instead of removing and
+                # recreating them, via temporary names so no rename collides with another layer
+                moved = [(layer, target_name) for layer, target_name in zip(mesh.uv_layers, target_names)
+                         if layer.name != target_name]
+                for i, (layer, _) in enumerate(moved):
+                    layer.name = f"__uv_reorder_{i}"
+                for layer, target_name in moved:
+                    layer.name = target_name
+                    uvs, flags = uv_data[target_name]
+                    layer.data.foreach_set('uv', uvs)
+                    for prop, values in flags.items():
+                        layer.data.foreach_set(prop, values)
                     
-                    # Recreate UV layers in the correct order
-                    for name, data in uv_data.items():
-                        if name != mesh.uv_layers[0].name:
-                            new_layer = mesh.uv_layers.new(name=name)
-                            for loop_idx, uv in enumerate(data['data']):
-                                new_layer.data[loop_idx].uv = uv
+                # Keep the same maps active for editing and rendering
+                if active_name:
+                    mesh.uv_layers.active = mesh.uv_layers[active_name]
+                if render_name:
+                    mesh.uv_layers[render_name].active_render = True
                                 
             return True
             
@@ -528,23 +712,22 @@ class ModelUtils:
             prev_mode = SceneUtils.ensure_mode(context, 'OBJECT')
             
             # Get all mesh objects
-            mesh_objects = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+            mesh_objects = _scene_meshes(context)
             if not mesh_objects:
                 print("No mesh objects found to merge")
                 return False
                 
             # Deselect all meshes
-            for obj in bpy.data.objects:
-                if obj.type == 'MESH':
-                    obj.select_set(False)
+            SceneUtils.deselect_meshes(context)
                 
             # Select all mesh objects and set active
             for obj in mesh_objects:
                 obj.select_set(True)
             context.view_layer.objects.active = mesh_objects[0]
             
-            # Join meshes
-            bpy.ops.object.join()
+            # Join meshes (a single mesh is already the result)
+            if len(mesh_objects) > 1:
+                bpy.ops.object.join()
             
             # Rename result
             context.active_object.name = "Body"
@@ -672,40 +855,36 @@ class ModelUtils:
             if not root_object.animation_data:
                 root_object.animation_data_create()
                 
+            # Modifier that each pose is baked through
+            modifier_name = face_obj.modifiers[0].name if face_obj.modifiers else None
+                
+            # Skip actions that don't match our patterns and numbered variations (like .001, .002, etc),
+            # extracting the shape key name (everything after the prefix, e.g. Emo_Face_) in the same pass
+            face_actions = [
+                (action, match) for action in bpy.data.actions
+                if (match := _FACE_ACTION_RE.match(action.name))
+            ]
+            
             # Process each action
-            for action in bpy.data.actions:
-                # Skip actions that don't match our patterns
-                if not any(pattern in action.name for pattern in ["Emo_", "Ani_", "PhotoGraph_"]):
-                    continue
-                    
-                # Skip numbered variations (like .001, .002, etc)
-                if re.search(r"\.\d{2,}$", action.name):
-                    continue
-                    
+            for i, (action, match) in enumerate(face_actions):
                 print(f"Processing action: {action.name}")
-                
-                # Extract shape key name from action name
-                name_parts = action.name.split("_")
-                if len(name_parts) < 3:
-                    continue
-                    
-                # Get everything after the prefix (Emo_, Ani_, etc)
-                shapekey_name = "_".join(name_parts[2:])
+                shapekey_name = match.group("key")
                 
                 # Apply the action
                 root_object.animation_data.action = action
                 bpy.ops.object.visual_transform_apply()
                 
                 # Create shape key from deformation
-                context.view_layer.objects.active = face_obj
-                if face_obj.modifiers:
-                    bpy.ops.object.modifier_apply_as_shapekey(
-                        keep_modifier=True,
-                        modifier=face_obj.modifiers[0].name
-                    )
+                # (override the context rather than changing the active object each action)
+                if modifier_name:
+                    with context.temp_override(active_object=face_obj, object=face_obj, selected_objects=[face_obj]):
+                        bpy.ops.object.modifier_apply_as_shapekey(
+                            keep_modifier=True,
+                            modifier=modifier_name
+                        )
                     
                     # Rename the shape key
-                    shape_key = ModelUtils.get_shape_key(face_obj.name, face_obj.modifiers[0].name)
+                    shape_key = ModelUtils.get_shape_key(face_obj.name, modifier_name)
                     if shape_key:
                         shape_key.name = shapekey_name
                         print(f"Created shape key: {shapekey_name}")
@@ -713,10 +892,10 @@ class ModelUtils:
                 # Reset pose before next action
                 ModelUtils.reset_pose(context, root_object)
                 
-                # Deselect all meshes
-                for obj in bpy.data.objects:
-                    if obj.type == 'MESH':
-                        obj.select_set(False)
+                # Deselect all meshes after the first action; baking runs in a context
+                # override, so nothing in this loop selects them again
+                if i == 0:
+                    SceneUtils.deselect_meshes(context)
             
             # Restore previous state
             if prev_action:
@@ -761,10 +940,10 @@ class ModelUtils:
                 armature.animation_data_clear()
                 print("Cleared armature animation data")
                 
-            # Clear action data
-            for action in bpy.data.actions:
-                if action.users == 0:
-                    bpy.data.actions.remove(action)
+            # Clear unused action data in a single batch
+            unused_actions = [action for action in bpy.data.actions if action.users == 0]
+            if unused_actions:
+                bpy.data.batch_remove(ids=unused_actions)
                     
             print("Animation cleanup complete")
             return True
@@ -826,7 +1005,7 @@ class ModelUtils:
                     vgroup = target.vertex_groups.new(name=group_name)
                 
                 # Add all vertices with specified weight
-                vertex_indices = [v.index for v in target.data.vertices]
+                vertex_indices = list(range(len(target.data.vertices)))
                 vgroup.add(vertex_indices, weight, 'REPLACE')
                 
             return True
@@ -852,7 +1031,7 @@ class ModelUtils:
             
         try:
             # Get all mesh objects
-            mesh_objects = [obj for obj in context.scene.objects if obj.type == 'MESH']
+            mesh_objects = _scene_meshes(context)
             
             if not mesh_objects:
                 return True
@@ -864,15 +1043,15 @@ class ModelUtils:
                 mesh_names = [obj.name for obj in mesh_objects]
                 
                 # Find common prefixes by looking for patterns like "Something_"
-                for name in mesh_names:
-                    # Split on underscores and dots
-                    parts = name.replace('.', '_').split('_')
-                    if len(parts) > 1:
-                        # Add the prefix with underscore
-                        prefix = parts[0] + '_'
-                        # Only add if it appears in multiple names
-                        if sum(1 for n in mesh_names if n.startswith(prefix)) > 1:
-                            prefixes_to_remove.add(prefix)
+                heads = [match.group() for match in map(_NAME_HEAD_RE.match, mesh_names) if match]
+                
+                # Only names whose first separator is '_' actually start with the prefix
+                prefix_counts = Counter(head for head in heads if head[-1] == '_')
+                for head in heads:
+                    prefix = head[:-1] + '_'
+                    # Only add if it appears in multiple names
+                    if prefix_counts[prefix] > 1:
+                        prefixes_to_remove.add(prefix)
             
             # Add any manually specified prefixes
             if remove_prefixes:
@@ -882,24 +1061,25 @@ class ModelUtils:
             if not prefixes_to_remove:
                 return True
                 
-            # Rename objects
-            for obj in mesh_objects:
-                # Start with original name
-                new_name = obj.name
+            # Remove every prefix/string in one pass, longest first so a shorter
+            # prefix never eats the start of a longer one
+            prefix_pattern = re.compile('|'.join(
+                re.escape(prefix) for prefix in sorted(prefixes_to_remove, key=len, reverse=True)
+            ))
+            
+            # Compute every new name up front from the names read once,
+            # cleaning up any leading/trailing underscores
+            old_names = [obj.name for obj in mesh_objects]
+            new_names = [prefix_pattern.sub('', name).strip('_') for name in old_names]
                 
-                # Remove each prefix/string
-                for prefix in prefixes_to_remove:
-                    new_name = new_name.replace(prefix, '')
-                    
-                # Clean up any leading/trailing underscores
-                new_name = new_name.strip('_')
-                    
-                # Set new name if changed
-                if new_name != obj.name:
+            # Rename objects whose name changed
+            for obj, old_name, new_name in zip(mesh_objects, old_names, new_names):
+                if new_name != old_name:
                     obj.name = new_name
                     # Also rename mesh data
-                    if obj.data:
-                        obj.data.name = new_name
+                    data = obj.data
+                    if data:
+                        data.name = new_name
                         
             return True
             
@@ -939,16 +1119,16 @@ class ModelUtils:
                         print("No mesh objects selected or active")
                         return False
             
-            # Rename each mesh
-            for i, obj in enumerate(meshes_to_rename):
-                # Add number suffix if multiple objects
-                suffix = f".{i:03d}" if len(meshes_to_rename) > 1 and i > 0 else ""
-                obj_name = f"{new_name}{suffix}"
-                
-                # Rename object and its data
-                obj.name = obj_name
-                if obj.data:
-                    obj.data.name = obj_name
+            # Number every object after the first
+            names = [new_name] + [f"{new_name}.{i:03d}" for i in range(1, len(meshes_to_rename))]
+            
+            # Rename each mesh and its data, skipping names that are already correct
+            for obj, obj_name in zip(meshes_to_rename, names):
+                if obj.name != obj_name:
+                    obj.name = obj_name
+                data = obj.data
+                if data and data.name != obj_name:
+                    data.name = obj_name
                     
             return True
             
@@ -972,6 +1152,10 @@ class ModelUtils:
         try:
             ob = context.edit_object
             me = ob.data
+            
+            # Sync the mesh arrays read below with the edit mesh, which may have
+            # changed since edit mode was entered (e.g. an earlier separate)
+            ob.update_from_editmode()
             bm = bmesh.from_edit_mesh(me)
             
             # Find the shape key
@@ -983,28 +1167,66 @@ class ModelUtils:
             # Find eye material indices
             eye_material_indices = {
                 i for i, mat in enumerate(ob.data.materials) 
-                if mat and (mat.name.endswith('Eye') or mat.name.endswith('Eyes'))
+                if mat and mat.name.endswith(('Eye', 'Eyes'))
             }
 
-            # Get vertices connected to eye materials
-            eye_verts = {
-                v.index for face in bm.faces 
-                if face.material_index in eye_material_indices 
-                for v in face.verts
-            }
+            # Get vertices connected to eye materials from the face/loop arrays
+            face_count = len(me.polygons)
+            material_indices = np.empty(face_count, dtype=np.int32)
+            me.polygons.foreach_get("material_index", material_indices)
+            loop_totals = np.empty(face_count, dtype=np.int32)
+            me.polygons.foreach_get("loop_total", loop_totals)
+            loop_verts = np.empty(len(me.loops), dtype=np.int32)
+            me.loops.foreach_get("vertex_index", loop_verts)
+
+            eye_faces = np.isin(material_indices, list(eye_material_indices))
+            eye_verts_mask = np.zeros(len(me.vertices), dtype=bool)
+            eye_verts_mask[loop_verts[np.repeat(eye_faces, loop_totals)]] = True
+            eye_verts = np.flatnonzero(eye_verts_mask).tolist()
+
+            # Measure every vertex's shape key offset in one vectorized pass
+            vert_count = len(me.vertices)
+            base_co = np.empty(vert_count * 3, dtype=np.float32)
+            me.vertices.foreach_get("co", base_co)
+            key_co = np.empty(vert_count * 3, dtype=np.float32)
+            shape_key.data.foreach_get("co", key_co)
+            diff = (key_co - base_co).reshape(-1, 3)
+            affected = np.einsum("ij,ij->i", diff, diff) > tolerance * tolerance
 
-            # Select vertices based on shape key and side
-            for v in bm.verts:
-                if v.index in eye_verts:
-                    bv = me.vertices[v.index]
-                    v.select = (shape_key.data[v.index].co - bv.co).length > tolerance
-                    if side == 'L' and v.co[0] < 0:
-                        v.select = False
-                    elif side == 'R' and v.co[0] >= 0:
-                        v.select = False
-
-            bpy.ops.mesh.select_more(use_face_step=False)
-            bmesh.update_edit_mesh(me)
+            # Select eye vertices based on shape key and side, mirroring the
+            # result into a mask on top of the existing selection
+            selected = np.empty(vert_count, dtype=bool)
+            me.vertices.foreach_get("select", selected)
+            bm.verts.ensure_lookup_table()
+            verts = bm.verts
+            for index in eye_verts:
+                v = verts[index]
+                if side == 'L':
+                    v.select = bool(affected[index]) and v.co[0] >= 0
+                elif side == 'R':
+                    v.select = bool(affected[index]) and v.co[0] < 0
+                else:
+                    v.select = bool(affected[index])
+                selected[index] = v.select
+
+            # Grow the selection across one ring of edges, like
+            # bpy.ops.mesh.select_more(use_face_step=False) without the operator,
+            # never reaching hidden vertices (select_more skips them too)
+            edge_verts = np.empty(len(me.edges) * 2, dtype=np.int32)
+            me.edges.foreach_get("vertices", edge_verts)
+            edge_verts = edge_verts.reshape(-1, 2)
+            hidden = np.empty(vert_count, dtype=bool)
+            me.vertices.foreach_get("hide", hidden)
+            expanded = selected.copy()
+            expanded[edge_verts[selected[edge_verts].any(axis=1)].ravel()] = True
+            for index in np.flatnonzero(expanded & ~selected & ~hidden).tolist():
+                verts[index].select = True
+
+            # The selection is built from vertices, so flush it up to edges and faces
+            # for the separate operator whatever the mesh select mode is
+            bm.select_flush(True)
+            # Only selection changed, so skip the loop triangle and topology rebuild
+            bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
             return True
             
         except Exception as e:
@@ -1024,23 +1246,39 @@ class ModelUtils:
             bool: True if successful
         """
         try:
-            bpy.context.view_layer.objects.active = obj
+            materials = obj.data.materials
+            slots = obj.material_slots
+            
+            # Popping from the mesh data only trims the tail of the object's own slot
+            # array instead of shifting it, which would misplace object-linked materials.
+            # With any object-linked slot, remove every slot through the operator.
+            use_operator = any(slot.link == 'OBJECT' for slot in slots)
+            if use_operator:
+                bpy.context.view_layer.objects.active = obj
+            
+            def remove_slot(i):
+                if use_operator:
+                    obj.active_material_index = i
+                    bpy.ops.object.material_slot_remove()
+                else:
+                    materials.pop(index=i)
             
+            # Walk the slots in reverse so earlier indices stay valid
             if remove_suffixes:
                 # Remove materials with specified suffixes
-                for i in reversed(range(len(obj.material_slots))):
-                    mat = obj.material_slots[i].material
-                    if mat and any(mat.name.endswith(suffix) for suffix in remove_suffixes):
-                        obj.active_material_index = i
-                        bpy.ops.object.material_slot_remove()
+                remove_suffixes = tuple(remove_suffixes)
+                for i in reversed(range(len(slots))):
+                    mat = slots[i].material
+                    if mat and mat.name.endswith(remove_suffixes):
+                        remove_slot(i)
                         
             elif keep_suffixes:
                 # Keep only materials with specified suffixes
-                for i in reversed(range(len(obj.material_slots))):
-                    mat = obj.material_slots[i].material
-                    if mat and not any(mat.name.endswith(suffix) for suffix in keep_suffixes):
-                        obj.active_material_index = i
-                        bpy.ops.object.material_slot_remove()
+                keep_suffixes = tuple(keep_suffixes)
+                for i in reversed(range(len(slots))):
+                    mat = slots[i].material
+                    if mat and not mat.name.endswith(keep_suffixes):
+                        remove_slot(i)
                         
             return True
             
@@ -1067,10 +1305,14 @@ class ModelUtils:
             bpy.context.view_layer.objects.active = obj
             bpy.ops.object.mode_set(mode='OBJECT')
 
-            for name in shape_key_names:
-                if name in obj.data.shape_keys.key_blocks:
-                    obj.active_shape_key_index = obj.data.shape_keys.key_blocks.keys().index(name)
-                    bpy.ops.object.shape_key_remove(all=False)
+            # Map names to indices once; removing from the highest index down
+            # keeps the remaining cached indices valid
+            idx_map = {kb.name: i for i, kb in enumerate(obj.data.shape_keys.key_blocks)}
+            indices = sorted({idx_map[name] for name in shape_key_names if name in idx_map}, reverse=True)
+
+            for index in indices:
+                obj.active_shape_key_index = index
+                bpy.ops.object.shape_key_remove(all=False)
                     
             return True
             
@@ -1095,9 +1337,12 @@ class ModelUtils:
             bool: True if successful
         """
         try:
-            # Get body mesh
-            body_obj = next((obj for obj in context.scene.objects 
-                           if obj.type == 'MESH' and body_mesh_name in obj.name), None)
+            # Get body mesh - an exact name hits the hash lookup; only fall back to a substring scan
+            scene_objects = context.scene.objects
+            body_obj = scene_objects.get(body_mesh_name)
+            if not body_obj or body_obj.type != 'MESH':
+                body_obj = next((obj for obj in scene_objects 
+                               if obj.type == 'MESH' and body_mesh_name in obj.name), None)
             if not body_obj:
                 print(f"Body mesh '{body_mesh_name}' not found")
                 return False
@@ -1115,130 +1360,80 @@ class ModelUtils:
                     for sk in body_obj.data.shape_keys.key_blocks
                 }
 
+            restored = False
             try:
-                # Process left eye
-                # Reset state
-                context.view_layer.objects.active = body_obj
-                body_obj.select_set(True)
+                # Leave only the body selected (it is already active and selected)
                 for obj in context.selected_objects:
                     if obj != body_obj:
                         obj.select_set(False)
                 
                 # Set target shape key to 1.0
-                if shape_key_name in body_obj.data.shape_keys.key_blocks:
-                    body_obj.data.shape_keys.key_blocks[shape_key_name].value = 1.0
+                target_key = body_obj.data.shape_keys.key_blocks.get(shape_key_name)
+                if target_key:
+                    target_key.value = 1.0
 
-                # Enter edit mode
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.select_all(action='DESELECT')
-                
-                # Separate left eye
-                ModelUtils.select_vertices_by_shape_key(context, 'L', shape_key_name)
-                bpy.ops.mesh.separate(type='SELECTED')
-                
-                # Return to object mode and process left eye
-                bpy.ops.object.mode_set(mode='OBJECT')
-                left_eye = next((obj for obj in context.selected_objects if obj != body_obj), None)
-                if left_eye:
-                    left_eye.name = "Left Eye"
-                    context.view_layer.objects.active = left_eye
-                    
-                    # Reset shape key values
-                    if left_eye.data.shape_keys:
-                        for sk_name, value in original_values.items():
-                            if sk_name in left_eye.data.shape_keys.key_blocks:
-                                left_eye.data.shape_keys.key_blocks[sk_name].value = value
-                                
-                        # Keep Basis (essential for proper eye mesh) and pupil shape keys only
-                        shape_keys_to_remove = []
-                        for shape_key in left_eye.data.shape_keys.key_blocks:
-                            # Always preserve Basis - without it, pupil shapes become default
-                            if shape_key.name == 'Basis':
-                                continue
-                            # Keep pupil shape keys on eye meshes
-                            if unused_shape_keys and shape_key.name in unused_shape_keys:
-                                continue
-                            # Remove all other shape keys (facial expressions, etc.)
-                            shape_keys_to_remove.append(shape_key.name)
-                        
-                        if shape_keys_to_remove:
-                            ModelUtils.remove_shape_keys(left_eye, shape_keys_to_remove)
-                                
-                    # Remove non-eye materials
-                    ModelUtils.remove_materials(left_eye, keep_suffixes=["Eye", "Eyes"])
+                # Shape keys kept on the eye meshes - Basis always, since without it
+                # pupil shapes become default, plus the pupil shape keys
+                eye_keep_keys = set(unused_shape_keys or ()) | {'Basis'}
                 
-                # Process right eye
-                # Reset state
-                context.view_layer.objects.active = body_obj
-                body_obj.select_set(True)
-                for obj in context.selected_objects:
-                    if obj != body_obj:
-                        obj.select_set(False)
-                
-                # Set target shape key to 1.0
-                if shape_key_name in body_obj.data.shape_keys.key_blocks:
-                    body_obj.data.shape_keys.key_blocks[shape_key_name].value = 1.0
-
-                # Enter edit mode
+                # Separate left eye, then right eye, in a single edit session
                 bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.select_all(action='DESELECT')
-                
-                # Separate right eye
-                ModelUtils.select_vertices_by_shape_key(context, 'R', shape_key_name)
-                bpy.ops.mesh.separate(type='SELECTED')
+                separated = []
+                known_objects = set(context.scene.objects)
+                for side, eye_name in (('L', "Left Eye"), ('R', "Right Eye")):
+                    bpy.ops.mesh.select_all(action='DESELECT')
+                    ModelUtils.select_vertices_by_shape_key(context, side, shape_key_name)
+                    bpy.ops.mesh.separate(type='SELECTED')
+                    
+                    eye = next((obj for obj in context.scene.objects if obj not in known_objects), None)
+                    if eye:
+                        known_objects.add(eye)
+                        separated.append((eye, eye_name))
                 
-                # Return to object mode and process right eye
+                # Return to object mode and process the separated eyes
                 bpy.ops.object.mode_set(mode='OBJECT')
-                right_eye = next((obj for obj in context.selected_objects if obj != body_obj and obj != left_eye), None)
-                if right_eye:
-                    right_eye.name = "Right Eye"
-                    context.view_layer.objects.active = right_eye
+                for eye, eye_name in separated:
+                    eye.name = eye_name
+                    context.view_layer.objects.active = eye
                     
                     # Reset shape key values
-                    if right_eye.data.shape_keys:
-                        for sk_name, value in original_values.items():
-                            if sk_name in right_eye.data.shape_keys.key_blocks:
-                                right_eye.data.shape_keys.key_blocks[sk_name].value = value
+                    if eye.data.shape_keys:
+                        _restore_shape_key_values(eye, original_values)
                                 
-                        # Keep Basis (essential for proper eye mesh) and pupil shape keys only
-                        shape_keys_to_remove = []
-                        for shape_key in right_eye.data.shape_keys.key_blocks:
-                            # Always preserve Basis - without it, pupil shapes become default
-                            if shape_key.name == 'Basis':
-                                continue
-                            # Keep pupil shape keys on eye meshes
-                            if unused_shape_keys and shape_key.name in unused_shape_keys:
-                                continue
-                            # Remove all other shape keys (facial expressions, etc.)
-                            shape_keys_to_remove.append(shape_key.name)
+                        # Keep Basis (essential for proper eye mesh) and pupil shape keys only;
+                        # remove all other shape keys (facial expressions, etc.)
+                        shape_keys_to_remove = [
+                            name for name in eye.data.shape_keys.key_blocks.keys()
+                            if name not in eye_keep_keys
+                        ]
                         
                         if shape_keys_to_remove:
-                            ModelUtils.remove_shape_keys(right_eye, shape_keys_to_remove)
+                            ModelUtils.remove_shape_keys(eye, shape_keys_to_remove)
                                 
                     # Remove non-eye materials
-                    ModelUtils.remove_materials(right_eye, keep_suffixes=["Eye", "Eyes"])
+                    ModelUtils.remove_materials(eye, keep_suffixes=["Eye", "Eyes"])
 
                 # Reset body shape key values
                 context.view_layer.objects.active = body_obj
-                for sk_name, value in original_values.items():
-                    if sk_name in body_obj.data.shape_keys.key_blocks:
-                        body_obj.data.shape_keys.key_blocks[sk_name].value = value
+                _restore_shape_key_values(body_obj, original_values)
+                restored = True
 
                 # Remove all pupil shape keys from body
                 if unused_shape_keys:
                     ModelUtils.remove_shape_keys(body_obj, unused_shape_keys)
 
-                # Cleanup
-                bpy.ops.object.select_all(action='DESELECT')
-                bpy.ops.object.mode_set(mode=original_mode)
+                # Cleanup - only the few selected objects need flipping
+                for obj in context.selected_objects:
+                    obj.select_set(False)
+                if context.mode != original_mode:
+                    bpy.ops.object.mode_set(mode=original_mode)
                 
                 return True
 
             finally:
-                # Restore shape key values if something went wrong
-                for sk_name, value in original_values.items():
-                    if sk_name in body_obj.data.shape_keys.key_blocks:
-                        body_obj.data.shape_keys.key_blocks[sk_name].value = value
+                # Restore shape key values if something went wrong before the reset above
+                if not restored:
+                    _restore_shape_key_values(body_obj, original_values)
 
         except Exception as e:
             print(f"Error separating eyes: {str(e)}")
@@ -1252,9 +1447,10 @@ class ModelUtils:
                                    color_multiplier: float = 255.0) -> bool:
         """Convert vertex colors to UV coordinates and create eye-related materials
         
-        Creates a new UV map populated with vertex color red channel data multiplied by the
-        color_multiplier, and creates EyeHi_UI and EyeShadow_UI materials by duplicating
-        the Eye_UI material. Assigns vertices to appropriate materials based on UV coordinates.
+        Computes UV coordinates from the vertex color red channel multiplied by the
+        color_multiplier (without storing them in a UV map), and creates EyeHi_UI and EyeShadow_UI
+        materials by duplicating the Eye_UI material. Assigns vertices to appropriate materials
+        based on those UV coordinates.
         
         Args:
             context: Optional context. If None, uses bpy.context
@@ -1269,12 +1465,12 @@ class ModelUtils:
             
         # Get target object (case insensitive)
         if target_object:
-            obj = None
-            # Search for object case-insensitively
-            for scene_obj in bpy.data.objects:
-                if scene_obj.name.lower() == target_object.lower():
-                    obj = scene_obj
-                    break
+            # Exact names hit the hash lookup; only fall back to a scan on a case mismatch
+            obj = bpy.data.objects.get(target_object)
+            if not obj:
+                target_lower = target_object.lower()
+                obj = next((scene_obj for scene_obj in bpy.data.objects
+                            if scene_obj.name.lower() == target_lower), None)
             
             if not obj:
                 print(f"No object found with name '{target_object}' (case insensitive)")
@@ -1287,16 +1483,16 @@ class ModelUtils:
             return False
             
         try:
-            # Replicate the original script exactly
             mesh = obj.data
-            bm = bmesh.new()
-            bm.from_mesh(mesh)
 
-            # Check if there's an active vertex color layer
-            color_layer = bm.loops.layers.color.active
-            if not color_layer:
+            # Find the active byte color corner layer - the layer BMesh exposes
+            # as loops.layers.color - falling back to the first one
+            color_attr = mesh.color_attributes.active_color
+            if not color_attr or color_attr.domain != 'CORNER' or color_attr.data_type != 'BYTE_COLOR':
+                color_attr = next((attr for attr in mesh.color_attributes
+                                   if attr.domain == 'CORNER' and attr.data_type == 'BYTE_COLOR'), None)
+            if not color_attr:
                 print(f"Object '{obj.name}' has no active vertex color layer.")
-                bm.free()
                 return False
 
             # Create new materials if they don't exist and assign them to the object
@@ -1312,144 +1508,120 @@ class ModelUtils:
             eye_shadow_material_name = material_prefix + "EyeShadow_UI"
 
             if eye_ui_material:
-                if eye_hi_material_name not in bpy.data.materials:
-                    material_eye_hi = eye_ui_material.copy()  # Duplicate
-                    material_eye_hi.name = eye_hi_material_name #rename
-                else:
-                    material_eye_hi = bpy.data.materials[eye_hi_material_name]
-                if eye_hi_material_name not in obj.data.materials:
-                    obj.data.materials.append(material_eye_hi)
-
-                if eye_shadow_material_name not in bpy.data.materials:
-                    material_eye_shadow = eye_ui_material.copy()  # Duplicate
-                    material_eye_shadow.name = eye_shadow_material_name #rename
-                else:
-                    material_eye_shadow = bpy.data.materials[eye_shadow_material_name]
-                if eye_shadow_material_name not in obj.data.materials:
-                    obj.data.materials.append(material_eye_shadow)
+                for material_name in (eye_hi_material_name, eye_shadow_material_name):
+                    material = bpy.data.materials.get(material_name)
+                    if not material:
+                        material = eye_ui_material.copy()  # Duplicate
+                        material.name = material_name #rename
+                    if material_name not in obj.data.materials:
+                        obj.data.materials.append(material)
             else:
                 print("Error: 'Eye_UI' material not found.  Cannot duplicate.")
-                bm.free()
                 return False
 
-            # Create a new UV layer
-            uv_layer = bm.loops.layers.uv.new()
-            new_uv_layer_index = len(mesh.uv_layers)  # Get the index before applying bmesh changes
-
-            # Initialize all UV coordinates to (0, 0)
-            for face in bm.faces:
-                for loop in face.loops:
-                    loop[uv_layer].uv = (0.0, 0.0)  # Initialize to (0, 0)
-
-            # Iterate through the faces and loops to set the UV coordinates
-            eye_ui_vertex_count = 0  # Initialize counter
-            for face in bm.faces:
-                # Check if the face has a material name containing "Eye_UI", "EyeHi_UI", or "EyeShadow_UI"
-                if face.material_index < len(mesh.materials) and mesh.materials[face.material_index] and any(
-                    eye_material in mesh.materials[face.material_index].name
-                    for eye_material in ["Eye_UI", "EyeHi_UI", "EyeShadow_UI"]
-                ):
-                    for loop in face.loops:
-                        color = loop[color_layer]
-                        u = color[0] * color_multiplier  # Red channel multiplied
-                        v = 0.5
-                        loop[uv_layer].uv = (u, v)  # Set the final UV Coord
-                        eye_ui_vertex_count += 1  # Increment counter
-
-            # Update the mesh with the changes
-            bm.to_mesh(mesh)
+            # Read face, loop and color data in one batch each into reused buffers
+            face_count = len(mesh.polygons)
+            loop_count = len(mesh.loops)
+            material_indices = _scratch_buffer("eye_ui_material_index", face_count, np.int32)
+            mesh.polygons.foreach_get("material_index", material_indices)
+            loop_starts = _scratch_buffer("eye_ui_loop_start", face_count, np.int32)
+            mesh.polygons.foreach_get("loop_start", loop_starts)
+            loop_totals = _scratch_buffer("eye_ui_loop_total", face_count, np.int32)
+            mesh.polygons.foreach_get("loop_total", loop_totals)
+            loop_verts = _scratch_buffer("eye_ui_loop_verts", loop_count, np.int32)
+            mesh.loops.foreach_get("vertex_index", loop_verts)
+            colors = _scratch_buffer("eye_ui_colors", loop_count * 4)
+            color_attr.data.foreach_get("color_srgb", colors)
 
-            # Now we can access the UV layer and check the coordinates.
-            mesh = obj.data
-            
-            # Get the newly created UV layer.
-            new_uv_layer = mesh.uv_layers[new_uv_layer_index]
-
-            # Create a set to store unique vertices that need to be assigned to EyeHi_UI
-            vertices_to_assign_eye_hi = set()
-            vertices_to_assign_eye_shadow = set()
-
-            # Iterate through the mesh data to find vertices with the target UV coordinates.
-            for face in mesh.polygons:
-                for loop_index in face.loop_indices:
-                    uv_coords = new_uv_layer.data[loop_index].uv
-                    # Check for each UV coordinate individually
-                    if (uv_coords[0] == 0 and uv_coords[1] == 0.5) or \
-                       (2.5 < uv_coords[0] < 3.5 and uv_coords[1] == 0.5) or \
-                       (uv_coords[0] == 4.0 and uv_coords[1] == 0.5):
-                        # Get the vertex index from the loop
-                        vert_index = mesh.loops[loop_index].vertex_index
-                        vertices_to_assign_eye_hi.add(vert_index)
-                    elif (0.5 < uv_coords[0] < 2.5 and uv_coords[1] == 0.5):
-                        # Get the vertex index from the loop
-                        vert_index = mesh.loops[loop_index].vertex_index
-                        vertices_to_assign_eye_shadow.add(vert_index)
-
-            # Assign the vertices to the EyeHi_UI material using BMesh.
-            if vertices_to_assign_eye_hi:
+            # Loops of faces with a material name containing "Eye_UI", "EyeHi_UI", or "EyeShadow_UI"
+            eye_slots = np.array([
+                bool(mat) and any(eye_material in mat.name for eye_material in ("Eye_UI", "EyeHi_UI", "EyeShadow_UI"))
+                for mat in mesh.materials
+            ], dtype=bool)
+            in_range = material_indices < len(eye_slots)
+            eye_faces = np.zeros(face_count, dtype=bool)
+            eye_faces[in_range] = eye_slots[material_indices[in_range]]
+            eye_loops = np.repeat(eye_faces, loop_totals)
+            eye_ui_vertex_count = int(np.count_nonzero(eye_loops))
+
+            # UV is (red * multiplier, 0.5) on eye loops and (0, 0) everywhere else
+            uvs = _scratch_buffer("eye_ui_uvs", loop_count * 2)
+            uvs.fill(0.0)
+            uvs[0::2][eye_loops] = colors[0::4][eye_loops].astype(np.float64) * color_multiplier
+            uvs[1::2][eye_loops] = 0.5
+
+            u = uvs[0::2]
+            on_row = uvs[1::2] == 0.5
+
+            # Classify loops by their U coordinate (red channel * multiplier)
+            hi_loops = on_row & ((u == 0) | ((u > 2.5) & (u < 3.5)) | (u == 4.0))
+            shadow_loops = on_row & (u > 0.5) & (u < 2.5) & ~hi_loops
+
+            # Unique vertices that need to be assigned to EyeHi_UI / EyeShadow_UI
+            vertices_to_assign_eye_hi = np.unique(loop_verts[hi_loops])
+            vertices_to_assign_eye_shadow = np.unique(loop_verts[shadow_loops])
+            vert_mask = np.zeros(len(mesh.vertices), dtype=bool)
+            face_hits = np.empty(face_count, dtype=bool)
+
+            # Slot index of each material name, keeping the first slot like materials.find
+            slot_indices = {}
+            for i, mat in enumerate(obj.data.materials):
+                if mat:
+                    slot_indices.setdefault(mat.name, i)
+
+            # Assign faces touching the vertices to the EyeHi_UI material.
+            assigned = False
+            if vertices_to_assign_eye_hi.size:
                 
                 #get the material index.
-                material_eye_hi_index = obj.data.materials.find(eye_hi_material_name)
+                material_eye_hi_index = slot_indices.get(eye_hi_material_name, -1)
                 
                 if material_eye_hi_index != -1:
-                    
-                    # Assign the material to the selected faces.
-                    for face in bm.faces:
-                        for loop in face.loops:
-                            if loop.vert.index in vertices_to_assign_eye_hi:
-                                face.material_index = material_eye_hi_index                                          
-                    
-                    # Update the mesh with the changes from the bmesh.
-                    bm.to_mesh(mesh)
-                    print(f"Vertices with UV coordinates (0, 0.5), (3, 0.5), and (4, 0.5) assigned to material '{eye_hi_material_name}'.")
+                    # A face is hit if any of its loops uses one of the vertices
+                    vert_mask[:] = False
+                    vert_mask[vertices_to_assign_eye_hi] = True
+                    _faces_touching(vert_mask, loop_verts, loop_starts, loop_totals, face_hits)
+                    material_indices[face_hits] = material_eye_hi_index
+                    assigned = True
+                    log.debug("Vertices with UV coordinates (0, 0.5), (3, 0.5), and (4, 0.5) assigned to material '%s'.", eye_hi_material_name)
                 else:
                     print(f"Error: Material '{eye_hi_material_name}' not found on object '{obj.name}'.")
             else:
-                print(f"No vertices found with UV coordinates (0, 0.5), (3, 0.5), or (4, 0.5).")
+                log.debug("No vertices found with UV coordinates (0, 0.5), (3, 0.5), or (4, 0.5).")
 
-            # Assign the vertices to the EyeShadow_UI material using BMesh.
-            if vertices_to_assign_eye_shadow:
+            # Assign faces touching the vertices to the EyeShadow_UI material.
+            if vertices_to_assign_eye_shadow.size:
                 
                 #get the material index.
-                material_eye_sdw_index = obj.data.materials.find(eye_shadow_material_name)
+                material_eye_sdw_index = slot_indices.get(eye_shadow_material_name, -1)
                 
                 if material_eye_sdw_index != -1:
-                    
-                    # Assign the material to the selected faces.
-                    for face in bm.faces:
-                        for loop in face.loops:
-                            if loop.vert.index in vertices_to_assign_eye_shadow:
-                                face.material_index = material_eye_sdw_index                                          
-                    
-                    # Update the mesh with the changes from the bmesh.
-                    bm.to_mesh(mesh)
-                    print(f"Vertices with UV coordinates (0.5 < x < 2.5, y = 0.5) assigned to material '{eye_shadow_material_name}'.")
+                    vert_mask[:] = False
+                    vert_mask[vertices_to_assign_eye_shadow] = True
+                    _faces_touching(vert_mask, loop_verts, loop_starts, loop_totals, face_hits)
+                    material_indices[face_hits] = material_eye_sdw_index
+                    assigned = True
+                    log.debug("Vertices with UV coordinates (0.5 < x < 2.5, y = 0.5) assigned to material '%s'.", eye_shadow_material_name)
                 else:
                     print(f"Error: Material '{eye_shadow_material_name}' not found on object '{obj.name}'.")
             else:
-                print(f"No vertices found with UV coordinates (0.5 < x < 2.5, y = 0.5).")
-            print(f"Number of vertices found for EyeShadow_UI: {len(vertices_to_assign_eye_shadow)}") # Debug line
+                log.debug("No vertices found with UV coordinates (0.5 < x < 2.5, y = 0.5).")
 
-            bm.free()
-            if len(mesh.uv_layers) > new_uv_layer_index:
-                uv_layer_name = mesh.uv_layers[new_uv_layer_index].name
-                print(f"Processing completed with temporary UV map on '{obj.name}'.")
-                print(
-                    f"Number of vertices processed for materials containing 'Eye_UI', 'EyeHi_UI', or 'EyeShadow_UI': {eye_ui_vertex_count}"
-                )  # Print the count
-                
-                # Remove the temporary UV layer
-                mesh.uv_layers.remove(mesh.uv_layers[new_uv_layer_index])
-                print(f"Temporary UV layer removed from '{obj.name}'.")
-            else:
-                print(f"Error: Could not find the temporary UV layer on '{obj.name}'.")
+            # Write all material indices back in a single batch, skipping the
+            # write and mesh update when no face matched either material
+            if assigned:
+                mesh.polygons.foreach_set("material_index", material_indices)
+                mesh.update()
+            log.debug("Number of vertices found for EyeShadow_UI: %d", len(vertices_to_assign_eye_shadow))
+            log.debug(
+                "Number of vertices processed for materials containing 'Eye_UI', 'EyeHi_UI', or 'EyeShadow_UI': %d",
+                eye_ui_vertex_count
+            )
                 
             return True
             
         except Exception as e:
             print(f"Error converting vertex colors to UV: {str(e)}")
-            if 'bm' in locals():
-                bm.free()
             return False
 
     @staticmethod
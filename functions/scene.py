@@ -187,6 +187,21 @@ class SceneUtils:
         # Clear active object
         context.view_layer.objects.active = None
 
+    @staticmethod
+    def deselect_meshes(context: Optional[bpy.types.Context] = None):
+        """Deselect all selected mesh objects, including hidden ones, in any mode
+        
+        Args:
+            context: Optional context. If None, uses bpy.context
+        """
+        if not context:
+            context = bpy.context
+            
+        # Snapshot the view layer's selection (hidden objects included) before changing it
+        for obj in list(context.view_layer.objects.selected):
+            if obj.type == 'MESH':
+                obj.select_set(False)
+
     @staticmethod
     def fix_materials(context: Optional[bpy.types.Context] = None) -> bool:
         """Set all material base color alpha settings to none and normal map strength to 0